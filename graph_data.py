@@ -17,6 +17,8 @@ limitations under the License.
 
 from io import StringIO
 import networkx as nx
+import numpy as np
+import pandas as pd
 
 # define a mapping between the 'speed' attribute and the 'weight' attribute
 speed_to_weight = {"10": 100, "100": 19, "1000": 4, "10000": 2, "100000": 1}
@@ -134,3 +136,60 @@ def get_dot_graph(dot_data):
     networkx.Graph: The graph object created from the DOT graph description.
     """
     return nx.Graph(nx.drawing.nx_pydot.read_dot(StringIO(dot_data)))
+
+
+def get_edge_frame(G):
+    """
+    Builds a DataFrame of link traffic from the edge attributes of the graph.
+
+    Only links that carry traffic in at least one direction are included.
+
+    Parameters:
+    G (networkx.Graph): Graph with flow attributes assigned.
+
+    Returns:
+    pandas.DataFrame: A frame with the columns 'Source', 'Target', 'FW' and 'BK'.
+    """
+
+    dr = nx.get_edge_attributes(G, "dr")
+    fw = np.fromiter(nx.get_edge_attributes(G, "fw").values(), float, len(dr))
+    bk = np.fromiter(nx.get_edge_attributes(G, "bk").values(), float, len(dr))
+
+    # The direction attribute holds the source and target of the edge
+    ends = pd.Series(list(dr.values()), dtype=str).str.split(",", n=1, expand=True)
+    if ends.empty:
+        ends = pd.DataFrame({0: [], 1: []}, dtype=str)
+
+    mask = (fw > 0) | (bk > 0)
+    return pd.DataFrame(
+        {
+            "Source": ends[0].to_numpy()[mask],
+            "Target": ends[1].to_numpy()[mask],
+            "FW": fw[mask],
+            "BK": bk[mask],
+        }
+    )
+
+
+def get_node_frame(G):
+    """
+    Builds a DataFrame of node traffic from the node attributes of the graph.
+
+    Only nodes that send or receive traffic are included.
+
+    Parameters:
+    G (networkx.Graph): Graph with flow attributes assigned.
+
+    Returns:
+    pandas.DataFrame: A frame with the columns 'Node', 'Outbound' and 'Inbound'.
+    """
+
+    tx = nx.get_node_attributes(G, "tx")
+    nodes = np.array(list(tx.keys()), dtype=object)
+    outbound = np.fromiter(tx.values(), float, len(tx))
+    inbound = np.fromiter(nx.get_node_attributes(G, "rx").values(), float, len(tx))
+
+    mask = (outbound > 0) | (inbound > 0)
+    return pd.DataFrame(
+        {"Node": nodes[mask], "Outbound": outbound[mask], "Inbound": inbound[mask]}
+    )
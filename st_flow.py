@@ -50,6 +50,9 @@ EDIT_FLOWS = r"""Edit the table below to enter traffic information.
 To delete a row, select it from the left side then hit DEL. Use CTRL to select multiple rows.
 """
 STP_HELP = "Use in switched networks."
+SEARCH_HELP = "Show only rows whose text columns contain this string."
+THRESHOLD_HELP = "Show only rows where the selected column exceeds this value."
+PAGE_SIZES = [10, 25, 50, 100]
 
 
 def clear_session_state():
@@ -75,6 +78,76 @@ def create_flows_frame():
     return df.astype(convert_dict)
 
 
+def filter_frame(df, search="", column=None, threshold=0.0):
+    """
+    Filter a DataFrame by a search string and a threshold on a numeric column.
+
+    Args:
+        df (DataFrame): The frame to filter.
+        search (str): Case-insensitive text matched against the text columns.
+        column (str): The numeric column to compare against the threshold.
+        threshold (float): Rows with column values not above this are dropped.
+
+    Returns:
+        The filtered DataFrame.
+    """
+    mask = pd.Series(True, index=df.index)
+    if search:
+        text_cols = df.select_dtypes(exclude="number").columns
+        found = pd.Series(False, index=df.index)
+        for col in text_cols:
+            found |= df[col].astype(str).str.contains(search, case=False, regex=False)
+        mask &= found
+    if column is not None:
+        mask &= df[column] > threshold
+    return df[mask]
+
+
+def show_paged_table(df, key):
+    """
+    Display a DataFrame one page at a time with sort, search and threshold
+    controls. Filtering and sorting are done on the server so that only the
+    visible page is sent to the browser.
+
+    Args:
+        df (DataFrame): The frame to display.
+        key (str): A unique prefix for the widget keys.
+
+    Returns:
+        None.
+    """
+    num_cols = list(df.select_dtypes(include="number").columns)
+
+    c1, c2, c3 = st.columns(3)
+    search = c1.text_input("Search", key=f"{key}_search", help=SEARCH_HELP)
+    column = c2.selectbox(
+        "Threshold column", [None] + num_cols, key=f"{key}_col", format_func=str
+    )
+    threshold = c3.number_input(
+        "Greater than", value=0.0, key=f"{key}_thr", help=THRESHOLD_HELP
+    )
+
+    c1, c2, c3 = st.columns(3)
+    sort_by = c1.selectbox("Sort by", list(df.columns), key=f"{key}_sort")
+    ascending = c2.radio(
+        "Order", ["Ascending", "Descending"], key=f"{key}_order", horizontal=True
+    )
+    page_size = c3.selectbox("Rows per page", PAGE_SIZES, key=f"{key}_size")
+
+    df_view = filter_frame(df, search, column, threshold)
+    df_view = df_view.sort_values(
+        sort_by, ascending=(ascending == "Ascending"), kind="stable"
+    )
+
+    pages = max(1, -(-len(df_view) // page_size))
+    page = st.number_input(
+        f"Page (of {pages})", min_value=1, max_value=pages, value=1, key=f"{key}_page"
+    )
+    start = (page - 1) * page_size
+    st.dataframe(df_view.iloc[start : start + page_size], use_container_width=True)
+    st.caption(f"{len(df_view)} of {len(df)} rows")
+
+
 def analyze_flows(topo_file, flow_file):
     """
     Analyze the flows in the given topology and flow information files.
@@ -145,22 +218,11 @@ def analyze_flows(topo_file, flow_file):
 
     st.header("Link Traffic")
     # Display the edge flows
-    edge_data = [
-        G[x][y]["dr"].split(",") + [G[x][y]["fw"], G[x][y]["bk"]] for x, y in G.edges
-    ]
-    df_edge = pd.DataFrame(edge_data, columns=("Source", "Target", "FW", "BK"))
-    df_edge_selected = df_edge[(df_edge["FW"] > 0) | (df_edge["BK"] > 0)]
-    st.dataframe(df_edge_selected, use_container_width=True)
+    show_paged_table(gd.get_edge_frame(G), "edge")
 
     st.header("Node Traffic")
     # Display the node attributes
-    node_data = [[n, G.nodes[n]["tx"], G.nodes[n]["rx"]] for n in G.nodes]
-    df_node = pd.DataFrame(node_data, columns=("Node", "Outbound", "Inbound"))
-
-    st.dataframe(
-        df_node[(df_node["Outbound"] > 0) | (df_node["Inbound"] > 0)],
-        use_container_width=True,
-    )
+    show_paged_table(gd.get_node_frame(G), "node")
 
     # Plotting the network graph
     plot_graph(ORG, G, df_flows, switching)